@@ -1,7 +1,34 @@
 """GAPx package public API surface."""
 
-from .config.loader import load_config
-from .runner import Runner
+from __future__ import annotations
 
-__all__ = ["load_config", "Runner"]
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .config.loader import load_config
+    from .runner import Runner
+
+__version__ = "0.1.0"
+
+__all__ = ["load_config", "Runner", "__version__"]
+
+_LAZY_ATTRIBUTES = {
+    "load_config": ".config.loader",
+    "Runner": ".runner",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: import the public entry points on first access only.
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
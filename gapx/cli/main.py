@@ -2,21 +2,35 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from ..config.loader import load_config, load_manifest
-from ..runner import Runner
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from rich.console import Console
+
+# Rich, the configuration loader, and the runner are imported inside the
+# commands that use them to keep CLI start-up cheap.
 
 app = typer.Typer(help="GA-based Integrated Gap-Filling & Pruning Framework")
-console = Console()
+cache_app = typer.Typer(help="Manage the parsed configuration cache")
+app.add_typer(cache_app, name="cache")
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    from rich.console import Console
+
+    return Console()
 
 
 def _print_config_summary(run_path: Path) -> None:
+    from rich.table import Table
+
+    from ..config.loader import load_config
+
     bundle = load_config(run_path)
     table = Table(title=f"GAPx Run: {bundle.run.name}")
     table.add_column("Section")
@@ -26,7 +40,7 @@ def _print_config_summary(run_path: Path) -> None:
     table.add_row("Tasks", str(len(bundle.tasks.tasks) if bundle.tasks else 0))
     table.add_row("GA Generations", str(bundle.ga.generations if bundle.ga else "?"))
     table.add_row("Population", str(bundle.ga.population if bundle.ga else "?"))
-    console.print(table)
+    _console().print(table)
 
 
 @app.command()
@@ -35,8 +49,10 @@ def validate(
 ) -> None:
     """Validate a configuration bundle and print a summary."""
 
+    from ..config.loader import load_config
+
     bundle = load_config(run)
-    console.print(f"[green]Configuration '{bundle.run.name}' validated successfully.[/green]")
+    _console().print(f"[green]Configuration '{bundle.run.name}' validated successfully.[/green]")
     _print_config_summary(run)
 
 
@@ -47,11 +63,14 @@ def run(
 ) -> None:
     """Execute the GA workflow using the provided configuration."""
 
+    from ..config.loader import load_config
+    from ..runner import Runner
+
     bundle = load_config(run)
     runner = Runner(bundle)
     result = runner.run(resume=resume)
     manifest_path = result.manifest_path or Path(bundle.run.output_dir) / "manifest.json"
-    console.print(f"[green]Run completed. Manifest saved to {manifest_path}[/green]")
+    _console().print(f"[green]Run completed. Manifest saved to {manifest_path}[/green]")
 
 
 @app.command()
@@ -61,6 +80,8 @@ def report(
 ) -> None:
     """Generate a placeholder report from an existing manifest."""
 
+    from ..config.loader import load_config, load_manifest
+
     manifest_path = run
     if run.is_dir():
         manifest_path = run / "manifest.json"
@@ -71,11 +92,23 @@ def report(
         bundle = load_manifest(manifest_path)
     else:
         bundle = load_config(manifest_path)
-    console.print(
+    _console().print(
         f"[yellow]Report generation stub for run '{bundle.run.name}' in format {format}[/yellow]"
     )
 
 
+@cache_app.command("clear")
+def cache_clear(
+    run: Path = typer.Option(..., exists=True, dir_okay=False, help="Root run configuration"),
+) -> None:
+    """Remove cached configuration bundles for a run."""
+
+    from ..config.loader import clear_config_cache
+
+    removed = clear_config_cache(run)
+    _console().print(f"[green]Removed {removed} cached configuration bundle(s).[/green]")
+
+
 if __name__ == "__main__":  # pragma: no cover
     app()
 
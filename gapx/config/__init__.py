@@ -1,7 +1,7 @@
 """Configuration models and loaders for GAPx."""
 
-from .loader import dump_manifest, load_config, load_manifest
+from .loader import clear_config_cache, dump_manifest, load_config, load_manifest
 from .models import RunBundle
 
-__all__ = ["dump_manifest", "load_config", "load_manifest", "RunBundle"]
+__all__ = ["clear_config_cache", "dump_manifest", "load_config", "load_manifest", "RunBundle"]
 
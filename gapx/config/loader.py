@@ -3,17 +3,33 @@
 from __future__ import annotations
 
 import ast
+import hashlib
 import json
+import mmap
+import os
+import pickle
 import re
+import shutil
+import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 try:  # pragma: no cover - optional dependency
     import yaml  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - fallback implemented below
     yaml = None
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - stdlib json used instead
+    orjson = None
+
+if yaml is not None:
+    # Prefer the libyaml-backed loader when PyYAML was built against it.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 from pydantic import BaseModel
 
+from .. import __version__
 from .models import (
     GAConfig,
     EssentialityConfig,
@@ -27,81 +43,109 @@ from .models import (
     ThermoConfig,
 )
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        text = handle.read()
-    if yaml is not None:
-        return yaml.safe_load(text) or {}
-    return _fallback_yaml_load(text)
-
+# Sub-config sections: InputsConfig field -> (model, optional wrapper key).
+_SECTION_MODELS: Dict[str, Tuple[Type[BaseModel], Optional[str]]] = {
+    "model_sources": (ModelSourcesConfig, None),
+    "tasks": (TasksConfig, None),
+    "ga": (GAConfig, "ga"),
+    "thermo": (ThermoConfig, "thermo"),
+    "genomic_evidence": (GenomicEvidenceConfig, "genomic_evidence"),
+    "scoring": (ScoringConfig, None),
+    "essentiality": (EssentialityConfig, "essentiality"),
+    "omics": (OmicsConfig, "omics"),
+}
+
+_MANIFEST_SCHEMA_KEY = "_gapx_schema_version"
+
+_CACHE_DIRNAME = ".gapx_cache"
+# Cached bundles skip validation, so the cache key also covers the modules
+# defining the bundle models and their validation.
+_SCHEMA_SOURCES = (
+    sys.modules[BaseModel.__module__].__file__,
+    sys.modules[RunBundle.__module__].__file__,
+    __file__,
+)
+_MMAP_THRESHOLD = 64 * 1024
 
-def _unwrap_section(data: Dict[str, Any], key: str) -> Dict[str, Any]:
-    section = data.get(key)
-    if isinstance(section, dict):
-        return section
-    return data
+# Quoted scalars are matched whole so bare-key rewriting never reaches inside them.
+_INLINE_TOKEN_RE = re.compile(
+    r"""("(?:[^"\\]|\\.)*")|('(?:[^']|'')*')|([\{,]\s*)([A-Za-z0-9_]+)\s*:"""
+    r"""|\b((?i:true|false|null|none))\b|(?<![\w~])(~)(?![\w~])"""
+)
+# Bare YAML scalars, matched case-insensitively as in ``_parse_scalar``.
+_INLINE_KEYWORDS = {"true": "true", "false": "false", "null": "null", "none": "null", "~": "null"}
+_INLINE_PY_KEYWORDS = {"true": "True", "false": "False", "null": "None", "none": "None", "~": "None"}
+_MERGE_ITEM = object()
 
 
 def _fallback_yaml_load(text: str) -> Dict[str, Any]:
-    """Very small YAML loader supporting the subset used in examples."""
-
-    lines = text.splitlines()
-
-    def parse_block(index: int, indent: int):
-        result: Any = None
-        while index < len(lines):
-            raw = lines[index]
-            stripped = raw.strip()
-            if not stripped or stripped.startswith("#"):
-                index += 1
-                continue
-            current_indent = len(raw) - len(raw.lstrip(" "))
-            if current_indent < indent:
-                break
-            if stripped.startswith("- "):
-                if result is None:
-                    result = []
-                elif not isinstance(result, list):
-                    raise ValueError("Mixed list/dict structures are not supported in fallback YAML parser")
-                value_str = stripped[2:].strip()
-                if value_str:
-                    if ":" in value_str and not value_str.startswith("{"):
-                        key, rest = value_str.split(":", 1)
-                        entry: Dict[str, Any] = {key.strip(): _parse_scalar(rest.strip())}
-                        index += 1
-                        child, index = parse_block(index, current_indent + 2)
-                        if isinstance(child, dict):
-                            entry.update(child)
-                        elif child not in (None, {}):
-                            raise ValueError("List item expected mapping in fallback YAML parser")
-                        result.append(entry)
-                    else:
-                        result.append(_parse_scalar(value_str))
-                        index += 1
-                else:
-                    value, index = parse_block(index + 1, current_indent + 2)
-                    result.append(value)
+    """Very small YAML loader supporting the subset used in examples.
+
+    Lines are scanned once, iteratively, against an explicit stack of open
+    blocks. Each block is ``[min_indent, container, parent, key]``; the
+    container is created lazily from its first line and written into
+    ``parent[key]`` (or merged into a list item's mapping) when the block
+    closes.
+    """
+
+    lines = []
+    for raw in text.splitlines():
+        content = raw.lstrip(" ")
+        stripped = content.strip()
+        if stripped and stripped[0] != "#":
+            lines.append((len(raw) - len(content), stripped, stripped[:2] == "- "))
+
+    def close(block: List[Any]) -> None:
+        _, value, parent, key = block
+        if value is None:
+            value = {}
+        if key is _MERGE_ITEM:
+            if not isinstance(value, dict):
+                raise ValueError("List item expected mapping in fallback YAML parser")
+            parent.update(value)
+        else:
+            parent[key] = value
+
+    root: List[Any] = [0, None, None, None]
+    stack = [root]
+    for indent, stripped, is_list_item in lines:
+        while indent < stack[-1][0]:
+            close(stack.pop())
+        block = stack[-1]
+        container = block[1]
+        if is_list_item:
+            if container is None:
+                container = block[1] = []
+            elif not isinstance(container, list):
+                raise ValueError("Mixed list/dict structures are not supported in fallback YAML parser")
+            # ``stripped`` carries no outer whitespace, so one-sided strips suffice.
+            value_str = stripped[2:].lstrip()
+            if ":" in value_str and value_str[0] != "{":
+                key, rest = value_str.split(":", 1)
+                entry: Dict[str, Any] = {key.rstrip(): _parse_scalar(rest.strip())}
+                container.append(entry)
+                stack.append([indent + 2, None, entry, _MERGE_ITEM])
             else:
-                if result is None:
-                    result = {}
-                elif not isinstance(result, dict):
-                    raise ValueError("Mixed list/dict structures are not supported in fallback YAML parser")
-                if ":" not in stripped:
-                    raise ValueError(f"Invalid YAML line: {stripped}")
-                key, rest = stripped.split(":", 1)
-                key = key.strip().strip('"')
-                rest = rest.strip()
-                if rest:
-                    result[key] = _parse_scalar(rest)
-                    index += 1
-                else:
-                    value, index = parse_block(index + 1, current_indent + 2)
-                    result[key] = value
-        if result is None:
-            result = {}
-        return result, index
-
-    data, _ = parse_block(0, 0)
+                container.append(_parse_scalar(value_str))
+        else:
+            if container is None:
+                container = block[1] = {}
+            elif not isinstance(container, dict):
+                raise ValueError("Mixed list/dict structures are not supported in fallback YAML parser")
+            if ":" not in stripped:
+                raise ValueError(f"Invalid YAML line: {stripped}")
+            key, rest = stripped.split(":", 1)
+            key = key.rstrip().strip('"')
+            rest = rest.strip()
+            if rest:
+                container[key] = _parse_scalar(rest)
+            else:
+                container[key] = None
+                stack.append([indent + 2, None, container, key])
+    while len(stack) > 1:
+        close(stack.pop())
+
+    data = root[1] if root[1] is not None else {}
     if not isinstance(data, dict):
         raise ValueError("Root of YAML document must be a mapping in fallback loader")
     return data
@@ -132,92 +176,210 @@ def _parse_scalar(value: str) -> Any:
 
 
 def _parse_inline_structure(value: str) -> Any:
-    value = _normalise_inline(value)
-    return ast.literal_eval(value)
+    try:
+        # Flow collections that are already valid JSON need no rewriting.
+        return json.loads(value)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return json.loads(_normalise_inline(value, _INLINE_KEYWORDS))
+    except json.JSONDecodeError:
+        # YAML numbers such as ``.5``, ``+1`` or ``1_000`` and trailing commas
+        # are not JSON but are valid Python literals.
+        return ast.literal_eval(_normalise_inline(value, _INLINE_PY_KEYWORDS))
+
+
+def _normalise_inline(value: str, keywords: Dict[str, str]) -> str:
+    """Rewrite an inline YAML flow collection as JSON (or Python literal) text."""
+
+    def replace_token(match: re.Match[str]) -> str:
+        double_quoted, single_quoted, prefix, key, keyword, tilde = match.groups()
+        if double_quoted is not None:
+            return double_quoted
+        if single_quoted is not None:
+            return json.dumps(single_quoted[1:-1].replace("''", "'"))
+        if key is not None:
+            return f'{prefix}"{key}":'
+        return keywords[(keyword or tilde).lower()]
+
+    return _INLINE_TOKEN_RE.sub(replace_token, value)
+
+
+def _read_yaml(path: str | os.PathLike[str]) -> Dict[str, Any]:
+    # Bytes go straight to the YAML reader, which detects the encoding itself.
+    with open(os.fspath(path), "rb") as handle:
+        if yaml is None:
+            return _fallback_yaml_load(handle.read().decode("utf-8"))
+        if os.fstat(handle.fileno()).st_size >= _MMAP_THRESHOLD:
+            # Large files are parsed straight from the mapped pages instead of
+            # being copied into an intermediate buffer first.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return yaml.load(mapped, Loader=_YamlLoader) or {}
+        return yaml.load(handle, Loader=_YamlLoader) or {}
+
+
+def _config_cache_dir(bundle: RunBundle) -> Path:
+    return Path(bundle.run.output_dir) / _CACHE_DIRNAME
+
+
+def _config_cache_key(path: Path, inputs: InputsConfig) -> str:
+    refs = [os.fspath(path), *_section_paths(path.parent, inputs).values(), *_SCHEMA_SOURCES]
+    digest = hashlib.sha1(__version__.encode("utf-8"))
+    for ref in refs:
+        try:
+            stat = os.stat(ref)
+            fingerprint = (os.path.realpath(ref), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprint = (ref, None, None)
+        digest.update(repr(fingerprint).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_cached_bundle(cache_file: Path) -> Optional[RunBundle]:
+    try:
+        with cache_file.open("rb") as handle:
+            cached = pickle.load(handle)
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+        return None
+    return cached if isinstance(cached, RunBundle) else None
 
 
-def _normalise_inline(value: str) -> str:
-    replacements = {
-        "true": "True",
-        "false": "False",
-        "null": "None",
-    }
+def _write_cached_bundle(cache_file: Path, bundle: RunBundle) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        with tmp_file.open("wb") as handle:
+            pickle.dump(bundle, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        # Only the newest entry for a run can still match; drop the ones
+        # superseded by config or schema edits.
+        for stale in cache_file.parent.glob("*.pkl"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # Caching is best-effort; an unwritable output directory must not
+        # prevent the configuration from loading.
+        pass
 
-    def replace_match(match: re.Match[str]) -> str:
-        return f"{match.group(1)}'{match.group(2)}':"
 
-    normalised = re.sub(r"([\{,]\s*)([A-Za-z0-9_]+)\s*:", replace_match, value)
-    for yaml_word, py_word in replacements.items():
-        normalised = re.sub(rf"\b{yaml_word}\b", py_word, normalised)
-    return normalised
+def load_config(path: str | Path) -> RunBundle:
+    """Load a root configuration file and resolve referenced sub-configs.
 
+    Resolved bundles are cached under ``<output_dir>/.gapx_cache`` keyed by the
+    gapx version and the path, modification time, and size of every referenced
+    file and schema module. Set the ``GAPX_NO_CACHE`` environment variable to
+    bypass the cache.
+    """
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        text = handle.read()
-    if yaml is not None:
-        return yaml.safe_load(text) or {}
-    return _fallback_yaml_load(text)
+    path = Path(path)
+    bundle = RunBundle.parse_obj(_read_yaml(path))
+    if os.environ.get("GAPX_NO_CACHE"):
+        return _load_sections(bundle, path.parent)
+
+    cache_file = _config_cache_dir(bundle) / f"{_config_cache_key(path, bundle.inputs)}.pkl"
+    cached = _read_cached_bundle(cache_file)
+    if cached is not None:
+        return cached
+    bundle = _load_sections(bundle, path.parent)
+    _write_cached_bundle(cache_file, bundle)
+    return bundle
 
 
-def load_config(path: str | Path) -> RunBundle:
-    """Load a root configuration file and resolve referenced sub-configs."""
+def clear_config_cache(path: str | Path) -> int:
+    """Remove cached bundles for the run described by ``path``.
 
-    path = Path(path)
-    root_data = _read_yaml(path)
-    bundle = RunBundle.parse_obj(root_data)
-
-    base_dir = path.parent
-    inputs: InputsConfig = bundle.inputs
-
-    def _load_optional(
-        loader: Callable[[Dict[str, Any]], BaseModel], ref: Optional[Path]
-    ) -> Optional[BaseModel]:
-        if ref is None:
-            return None
-        return loader(_read_yaml(base_dir / ref))
-
-    bundle.model_sources = ModelSourcesConfig.parse_obj(
-        _read_yaml(base_dir / inputs.model_sources)
-    )
-    bundle.tasks = TasksConfig.parse_obj(_read_yaml(base_dir / inputs.tasks))
-    bundle.ga = GAConfig.parse_obj(
-        _unwrap_section(_read_yaml(base_dir / inputs.ga), "ga")
-    )
-    bundle.thermo = ThermoConfig.parse_obj(
-        _unwrap_section(_read_yaml(base_dir / inputs.thermo), "thermo")
-    )
-    bundle.genomic_evidence = GenomicEvidenceConfig.parse_obj(
-        _unwrap_section(_read_yaml(base_dir / inputs.genomic_evidence), "genomic_evidence")
-    )
-    bundle.scoring = ScoringConfig.parse_obj(_read_yaml(base_dir / inputs.scoring))
-    bundle.essentiality = _load_optional(
-        lambda data: EssentialityConfig.parse_obj(_unwrap_section(data, "essentiality")),
-        inputs.essentiality,
-    )
-    bundle.omics = _load_optional(
-        lambda data: OmicsConfig.parse_obj(_unwrap_section(data, "omics")),
-        inputs.omics,
-    )
+    Returns the number of cache entries removed.
+    """
+
+    bundle = RunBundle.parse_obj(_read_yaml(Path(path)))
+    cache_dir = _config_cache_dir(bundle)
+    if not cache_dir.is_dir():
+        return 0
+    removed = sum(1 for _ in cache_dir.glob("*.pkl"))
+    shutil.rmtree(cache_dir)
+    return removed
+
+
+def _section_paths(base_dir: Path, inputs: InputsConfig) -> Dict[str, str]:
+    """Resolve the path of every sub-config referenced by ``inputs``."""
+
+    paths: Dict[str, str] = {}
+    for name in _SECTION_MODELS:
+        ref = getattr(inputs, name)
+        if ref is not None:
+            paths[name] = os.fspath(base_dir / ref)
+    return paths
+
+
+def _read_sections(paths: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """Read every referenced sub-config, keyed by section name."""
 
+    # Sequential on purpose: the YAML constructors hold the GIL, so a thread
+    # pool measured slower for both the small example files and large inputs.
+    return {name: _read_yaml(path) for name, path in paths.items()}
+
+
+def _load_sections(bundle: RunBundle, base_dir: Path) -> RunBundle:
+    raw = _read_sections(_section_paths(base_dir, bundle.inputs))
+    for name, (model, wrapper_key) in _SECTION_MODELS.items():
+        data = raw.get(name)
+        if data is None:
+            setattr(bundle, name, None)
+            continue
+        if wrapper_key is not None:
+            # Sections may be nested under their own name, e.g. ``ga: {...}``.
+            section = data.get(wrapper_key)
+            if isinstance(section, dict):
+                data = section
+        setattr(bundle, name, model.parse_obj(data))
     return bundle
 
 
 def dump_manifest(bundle: RunBundle, path: str | Path) -> None:
-    """Persist a run manifest capturing resolved configuration and metadata."""
+    """Persist a run manifest capturing resolved configuration and metadata.
+
+    With orjson installed, non-finite floats are written as ``null`` because
+    JSON has no NaN or Infinity; the stdlib encoder writes them as the
+    ``NaN``/``Infinity`` extension tokens.
+    """
 
     manifest_path = Path(path)
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
-    data = json.loads(bundle.json())
+    data = bundle.dict()
+    data[_MANIFEST_SCHEMA_KEY] = __version__
+    if orjson is not None:
+        manifest_path.write_bytes(
+            orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
     with manifest_path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2)
+        json.dump(data, handle, indent=2, default=str)
 
 
-def load_manifest(path: str | Path) -> RunBundle:
-    """Load a previously generated manifest."""
+def _loads_manifest(raw: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens the stdlib writes for
+            # non-finite floats.
+            pass
+    return json.loads(raw)
 
-    manifest_path = Path(path)
-    with manifest_path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
-    return RunBundle.parse_obj(data)
 
+def load_manifest(path: str | Path) -> RunBundle:
+    """Load a previously generated manifest.
+
+    Manifests written by the current gapx version were validated
+    before they were dumped, so they are rebuilt with ``RunBundle.construct``
+    without re-running validation. Older or foreign manifests go through
+    ``RunBundle.parse_obj``.
+    """
+
+    data = _loads_manifest(Path(path).read_bytes())
+    if data.pop(_MANIFEST_SCHEMA_KEY, None) == __version__:
+        try:
+            return RunBundle.construct(**data)
+        except (TypeError, AttributeError, ValueError):
+            pass
+    return RunBundle.parse_obj(data)
@@ -4,7 +4,23 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+from pathlib import PurePath
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 __all__ = ["BaseModel", "Field", "validator"]
 
@@ -40,6 +56,81 @@ def validator(*fields: str, pre: bool = False) -> Callable[[ValidatorFunc], Vali
 
 T = TypeVar("T", bound="BaseModel")
 
+Coercer = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _compile_coercer(hint: Any, name: str, trusted: bool = False) -> Coercer:
+    """Build a coercion function for field ``name`` once, at class-resolution time.
+
+    ``trusted`` coercers back ``BaseModel.construct``: they skip Literal checks
+    and only rebuild nested models, containers, and paths from plain data.
+    """
+
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is Union and type(None) in args:
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) != 1:
+            # Values of multi-member unions are passed through unchanged.
+            return _identity
+        inner = _compile_coercer(non_none[0], name, trusted)
+        if inner is _identity:
+            return _identity
+        return lambda value: None if value is None else inner(value)
+    if origin is Literal and not trusted:
+        allowed = frozenset(args)
+
+        def check_literal(value: Any) -> Any:
+            try:
+                if value in allowed:
+                    return value
+            except TypeError:  # unhashable values can never match
+                pass
+            raise ValueError(f"Invalid value {value!r} for field '{name}'; expected one of {args!r}")
+
+        return check_literal
+    if origin is None and hasattr(hint, "__origin__"):
+        origin = hint.__origin__  # type: ignore[attr-defined]
+        args = getattr(hint, "__args__", ())
+    if isinstance(hint, type) and issubclass(hint, BaseModel):
+        if trusted:
+            return lambda value: hint.construct(**value) if isinstance(value, dict) else value
+        return lambda value: hint.parse_obj(value) if isinstance(value, dict) else value
+    if trusted and isinstance(hint, type) and issubclass(hint, PurePath):
+        return hint
+    if origin in {list, List, tuple, Tuple} and args:
+        item = _compile_coercer(args[0], name, trusted)
+        return lambda value: [item(entry) for entry in value]
+    if origin in {dict, Dict} and len(args) == 2:
+        key_coercer = _compile_coercer(args[0], name, trusted)
+        value_coercer = _compile_coercer(args[1], name, trusted)
+        return lambda value: {key_coercer(key): value_coercer(val) for key, val in value.items()}
+    return _identity
+
+
+_PROTOTYPE_SAFE_FACTORIES = (list, dict, tuple, set, frozenset)
+
+
+def _clone_value(value: Any) -> Any:
+    """Copy the mutable structure (models, lists, dicts, sets) of a prototype value."""
+
+    if isinstance(value, BaseModel):
+        clone = object.__new__(type(value))
+        for name in value.__field_names__:
+            setattr(clone, name, _clone_value(getattr(value, name)))
+        return clone
+    if isinstance(value, list):
+        return [_clone_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _clone_value(item) for key, item in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return value
+
 
 class ModelMeta(type):
     def __new__(mcls, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]):
@@ -59,10 +150,12 @@ class ModelMeta(type):
                 namespace.pop(attr)
 
         for attr, hint in annotations.items():
-            if attr in field_defaults:
-                continue
+            # FieldInfo values were already popped, so anything left is a plain
+            # default declared (or overridden) on this class.
             if attr in namespace:
-                candidate = namespace[attr]
+                # Any class attribute would clash with the field's slot. Callable
+                # values are not treated as defaults, so they are only dropped.
+                candidate = namespace.pop(attr)
                 if not callable(candidate):
                     field_defaults[attr] = FieldInfo(default=candidate)
 
@@ -73,52 +166,165 @@ class ModelMeta(type):
                 for field in fields:
                     validators.setdefault(field, []).append((obj, pre))
 
+        inherited_slots = {
+            slot for base in bases for klass in base.__mro__ for slot in getattr(klass, "__slots__", ())
+        }
+        namespace.setdefault(
+            "__slots__",
+            tuple(
+                attr
+                for attr in annotations
+                if not attr.startswith("__") and attr not in namespace and attr not in inherited_slots
+            ),
+        )
         namespace["__field_defaults__"] = field_defaults
         namespace["__validators__"] = validators
-        return super().__new__(mcls, name, bases, namespace)
+        namespace["__has_validators_pre__"] = frozenset(
+            field for field, funcs in validators.items() if any(is_pre for _, is_pre in funcs)
+        )
+        namespace["__has_validators_post__"] = frozenset(
+            field for field, funcs in validators.items() if not all(is_pre for _, is_pre in funcs)
+        )
+        namespace["__resolved_hints__"] = None
+        namespace["__field_names__"] = None
+        namespace["__coercers__"] = None
+        namespace["__constructors__"] = None
+        namespace["__default_prototype__"] = None
+        cls = super().__new__(mcls, name, bases, namespace)
+        try:
+            cls._resolve_fields()
+        except NameError:
+            # Forward references are resolved by update_forward_refs() or on first use.
+            pass
+        return cls
 
 
 class BaseModel(metaclass=ModelMeta):
+    __slots__ = ()
     __field_defaults__: Dict[str, FieldInfo]
     __validators__: Dict[str, List[Tuple[ValidatorFunc, bool]]]
+    __has_validators_pre__: FrozenSet[str]
+    __has_validators_post__: FrozenSet[str]
+    __resolved_hints__: Optional[Dict[str, Any]]
+    __field_names__: Optional[Tuple[str, ...]]
+    __coercers__: Optional[Dict[str, Coercer]]
+    __constructors__: Optional[Dict[str, Coercer]]
+    __default_prototype__: Optional["BaseModel"]
 
     def __init__(self, **data: Any) -> None:
-        hints = get_type_hints(type(self), include_extras=True)
+        if not data:
+            prototype = self.__default_prototype__
+            if prototype is not None:
+                for name in self.__field_names__:
+                    setattr(self, name, _clone_value(getattr(prototype, name)))
+                return
+        hints = self.__resolved_hints__
+        if hints is None:
+            hints = self._resolve_fields()
+        coercers = self.__coercers__
+        has_pre = self.__has_validators_pre__
+        has_post = self.__has_validators_post__
         for name, hint in hints.items():
-            if name.startswith("__"):
-                continue
             value = data.get(name, MISSING)
-            field_info = self.__field_defaults__.get(name)
             if value is MISSING:
-                if field_info is not None:
-                    if field_info.default is not MISSING:
-                        value = field_info.default
-                    elif field_info.default_factory is not None:
-                        value = field_info.default_factory()
-                if value is MISSING:
-                    if self._allows_none(hint):
-                        value = None
-                    else:
-                        raise ValueError(f"Missing required field '{name}' for {type(self).__name__}")
-            value = self._apply_validators(name, value, pre=True)
-            value = self._coerce_type(name, hint, value)
-            value = self._apply_validators(name, value, pre=False)
+                value = self._default_value(name, hint)
+            if name in has_pre:
+                value = self._apply_validators(name, value, pre=True)
+            value = coercers[name](value)
+            if name in has_post:
+                value = self._apply_validators(name, value, pre=False)
             setattr(self, name, value)
 
     @classmethod
     def parse_obj(cls: Type[T], data: Dict[str, Any]) -> T:
         return cls(**data)
 
+    @classmethod
+    def construct(cls: Type[T], **values: Any) -> T:
+        """Build an instance from trusted data without running validators.
+
+        Nested models, containers, and paths are rebuilt from their plain
+        representations; missing fields take their defaults.
+        """
+
+        hints = cls.__resolved_hints__
+        if hints is None:
+            hints = cls._resolve_fields()
+        instance = object.__new__(cls)
+        for name, build in cls.__constructors__.items():
+            value = values.get(name, MISSING)
+            if value is MISSING:
+                value = cls._default_value(name, hints[name])
+            setattr(instance, name, build(value))
+        return instance
+
     def dict(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {}
-        hints = get_type_hints(type(self), include_extras=True)
-        for name in hints:
+        names = self.__field_names__
+        if names is None:
+            names = tuple(self._resolve_fields())
+        for name in names:
             value = getattr(self, name)
             result[name] = self._export_value(value)
         return result
 
-    def json(self) -> str:
-        return json.dumps(self.dict())
+    def json(self, **dumps_kwargs: Any) -> str:
+        return json.dumps(self, cls=_ModelEncoder, **dumps_kwargs)
+
+    @classmethod
+    def _resolve_fields(cls) -> Dict[str, Any]:
+        """Resolve and cache the field type hints and coercers for this class."""
+
+        hints = get_type_hints(cls, include_extras=True)
+        resolved = {name: hint for name, hint in hints.items() if not name.startswith("__")}
+        cls.__coercers__ = {name: _compile_coercer(hint, name) for name, hint in resolved.items()}
+        cls.__constructors__ = {
+            name: _compile_coercer(hint, name, trusted=True) for name, hint in resolved.items()
+        }
+        cls.__field_names__ = tuple(resolved)
+        cls.__resolved_hints__ = resolved
+        cls.__default_prototype__ = cls._build_default_prototype()
+        return resolved
+
+    @classmethod
+    def _build_default_prototype(cls: Type[T]) -> Optional[T]:
+        """Build the all-defaults instance that ``cls()`` is cloned from, if safe.
+
+        Only classes without validators or required fields, whose default
+        factories are containers or other models, get a prototype.
+        """
+
+        if cls.__validators__:
+            return None
+        for name, hint in cls.__resolved_hints__.items():
+            field_info = cls.__field_defaults__.get(name)
+            if field_info is None or (field_info.default is MISSING and field_info.default_factory is None):
+                if not cls._allows_none(hint):
+                    return None
+            elif field_info.default is MISSING:
+                factory = field_info.default_factory
+                if not (
+                    isinstance(factory, type)
+                    and (issubclass(factory, BaseModel) or factory in _PROTOTYPE_SAFE_FACTORIES)
+                ):
+                    return None
+        try:
+            return cls()
+        except Exception:
+            # Let the error surface from the caller's own construction instead.
+            return None
+
+    @classmethod
+    def _default_value(cls, name: str, hint: Any) -> Any:
+        field_info = cls.__field_defaults__.get(name)
+        if field_info is not None:
+            if field_info.default is not MISSING:
+                return field_info.default
+            if field_info.default_factory is not None:
+                return field_info.default_factory()
+        if cls._allows_none(hint):
+            return None
+        raise ValueError(f"Missing required field '{name}' for {cls.__name__}")
 
     @classmethod
     def _apply_validators(cls, name: str, value: Any, pre: bool) -> Any:
@@ -127,43 +333,6 @@ class BaseModel(metaclass=ModelMeta):
                 value = func(cls, value)
         return value
 
-    @classmethod
-    def _coerce_type(cls, name: str, hint: Any, value: Any) -> Any:
-        origin = get_origin(hint)
-        args = get_args(hint)
-        if origin is Union and type(None) in args:
-            non_none = [arg for arg in args if arg is not type(None)]
-            if value is None:
-                return None
-            target = non_none[0] if non_none else Any
-            return cls._coerce_type(name, target, value)
-        if origin is Optional:
-            inner = args[0]
-            if value is None:
-                return None
-            return cls._coerce_type(name, inner, value)
-        if origin is None and hasattr(hint, "__origin__"):
-            origin = hint.__origin__  # type: ignore[attr-defined]
-            args = getattr(hint, "__args__", ())
-        if origin is None:
-            literal_args = getattr(hint, "__args__", ()) if getattr(hint, "__origin__", None) is None else ()
-            if literal_args:
-                return value
-        if isinstance(hint, type) and issubclass(hint, BaseModel):
-            if isinstance(value, hint):
-                return value
-            if isinstance(value, dict):
-                return hint.parse_obj(value)
-        if origin in {list, List, tuple, Tuple} and args:
-            return [cls._coerce_type(name, args[0], item) for item in value]
-        if origin in {dict, Dict} and len(args) == 2:
-            key_type, value_type = args
-            return {
-                cls._coerce_type(name, key_type, key): cls._coerce_type(name, value_type, val)
-                for key, val in value.items()
-            }
-        return value
-
     @staticmethod
     def _allows_none(hint: Any) -> bool:
         origin = get_origin(hint)
@@ -184,9 +353,24 @@ class BaseModel(metaclass=ModelMeta):
             return [BaseModel._export_value(v) for v in value]
         if isinstance(value, dict):
             return {k: BaseModel._export_value(v) for k, v in value.items()}
+        if isinstance(value, PurePath):
+            return str(value)
         return value
 
     @classmethod
-    def update_forward_refs(cls, **_: Any) -> None:  # pragma: no cover - compatibility stub
-        return None
-
+    def update_forward_refs(cls, **_: Any) -> None:
+        cls._resolve_fields()
+
+
+class _ModelEncoder(json.JSONEncoder):
+    """Encode models while ``json`` walks the graph, avoiding an intermediate ``dict()``."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, BaseModel):
+            names = o.__field_names__
+            if names is None:
+                names = tuple(o._resolve_fields())
+            return {name: getattr(o, name) for name in names}
+        if isinstance(o, PurePath):
+            return str(o)
+        return super().default(o)
@@ -1,14 +1,192 @@
+import json
+import math
+import os
+import shutil
 from pathlib import Path
 
-from gapx.config.loader import load_config
+import pytest
+
+import gapx
+import gapx.config.loader as loader
+from gapx.config.loader import (
+    _MMAP_THRESHOLD,
+    _fallback_yaml_load,
+    _parse_inline_structure,
+    _read_yaml,
+    clear_config_cache,
+    dump_manifest,
+    load_config,
+    load_manifest,
+)
+
+CONFIG_DIR = Path(__file__).parent.parent / "examples" / "config"
+RUN_CONFIG = CONFIG_DIR / "run.yaml"
+
+
+@pytest.fixture(autouse=True)
+def _isolated_output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # The example run writes its output (and config cache) relative to the CWD.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GAPX_NO_CACHE", raising=False)
 
 
 def test_load_example_bundle(tmp_path: Path) -> None:
-    run_config = Path(__file__).parent.parent / "examples" / "config" / "run.yaml"
-    bundle = load_config(run_config)
+    bundle = load_config(RUN_CONFIG)
 
     assert bundle.run.name == "ecoli_gapx_demo"
     assert bundle.ga.generations == 150
     assert bundle.tasks is not None
     assert len(bundle.tasks.tasks) == 2
 
+
+def test_load_config_uses_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config_dir = tmp_path / "config"
+    shutil.copytree(CONFIG_DIR, config_dir)
+    run_config = config_dir / "run.yaml"
+
+    first = load_config(run_config)
+    cache_dir = Path(first.run.output_dir) / ".gapx_cache"
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    load_sections = loader._load_sections
+
+    def _fail(*_: object) -> None:
+        raise AssertionError("sub-configs were re-read")
+
+    monkeypatch.setattr(loader, "_load_sections", _fail)
+    second = load_config(run_config)
+    assert second.dict() == first.dict()
+
+    tasks = config_dir / "tasks.yaml"
+    stat = tasks.stat()
+    os.utime(tasks, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with pytest.raises(AssertionError, match="re-read"):
+        load_config(run_config)
+
+    monkeypatch.setattr(loader, "_load_sections", load_sections)
+    stale = list(cache_dir.glob("*.pkl"))
+    load_config(run_config)
+    fresh = list(cache_dir.glob("*.pkl"))
+    assert len(fresh) == 1 and fresh != stale
+
+    assert clear_config_cache(run_config) == 1
+    assert not cache_dir.exists()
+
+
+def test_config_cache_tracks_schema_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    schema_source = tmp_path / "models.py"
+    schema_source.write_text("# schema\n")
+    monkeypatch.setattr(loader, "_SCHEMA_SOURCES", (os.fspath(schema_source),))
+    run_config = CONFIG_DIR / "run.yaml"
+    inputs = load_config(run_config).inputs
+    key = loader._config_cache_key(run_config, inputs)
+    assert loader._config_cache_key(run_config, inputs) == key
+
+    stat = schema_source.stat()
+    os.utime(schema_source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert loader._config_cache_key(run_config, inputs) != key
+
+
+def test_load_config_cache_can_be_disabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GAPX_NO_CACHE", "1")
+    bundle = load_config(RUN_CONFIG)
+
+    assert not (Path(bundle.run.output_dir) / ".gapx_cache").exists()
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    bundle = load_config(RUN_CONFIG)
+    manifest_path = tmp_path / "manifest.json"
+
+    dump_manifest(bundle, manifest_path)
+    reloaded = load_manifest(manifest_path)
+
+    assert reloaded.run.name == bundle.run.name
+    assert reloaded.run.output_dir == bundle.run.output_dir
+    assert reloaded.tasks.dict() == bundle.tasks.dict()
+    assert reloaded.ga.dict() == bundle.ga.dict()
+
+
+def test_manifest_round_trips_non_finite_floats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(loader, "orjson", None)
+    bundle = load_config(RUN_CONFIG)
+    bundle.thermo.loop_penalty = float("nan")
+    bundle.thermo.temperature_K = float("inf")
+    manifest_path = tmp_path / "manifest.json"
+
+    dump_manifest(bundle, manifest_path)
+    reloaded = load_manifest(manifest_path)
+
+    assert math.isnan(reloaded.thermo.loop_penalty)
+    assert reloaded.thermo.temperature_K == float("inf")
+    assert reloaded.tasks.dict() == bundle.tasks.dict()
+
+
+def test_orjson_manifest_writes_non_finite_floats_as_null(tmp_path: Path) -> None:
+    pytest.importorskip("orjson")
+    bundle = load_config(RUN_CONFIG)
+    bundle.thermo.loop_penalty = float("nan")
+    manifest_path = tmp_path / "manifest.json"
+
+    dump_manifest(bundle, manifest_path)
+
+    assert json.loads(manifest_path.read_bytes())["thermo"]["loop_penalty"] is None
+
+
+def test_manifest_without_schema_marker_is_revalidated(tmp_path: Path) -> None:
+    bundle = load_config(RUN_CONFIG)
+    manifest_path = tmp_path / "manifest.json"
+    dump_manifest(bundle, manifest_path)
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    assert data.pop("_gapx_schema_version") == gapx.__version__
+    manifest_path.write_text(json.dumps(data), encoding="utf-8")
+
+    reloaded = load_manifest(manifest_path)
+
+    assert reloaded.run.output_dir == bundle.run.output_dir
+    assert reloaded.tasks.dict() == bundle.tasks.dict()
+
+
+def test_read_yaml_large_file(tmp_path: Path) -> None:
+    target = tmp_path / "large.yaml"
+    lines = [f"key_{index}: {index}" for index in range(_MMAP_THRESHOLD // 8)]
+    target.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert target.stat().st_size >= _MMAP_THRESHOLD
+
+    data = _read_yaml(target)
+
+    assert len(data) == len(lines)
+    assert data["key_10"] == 10
+
+
+# omics.yaml uses ``on``/``off`` keys, which PyYAML resolves to YAML 1.1 booleans.
+@pytest.mark.parametrize(
+    "config",
+    sorted(path for path in CONFIG_DIR.glob("*.yaml") if path.name != "omics.yaml"),
+    ids=lambda path: path.name,
+)
+def test_fallback_yaml_matches_pyyaml(config: Path) -> None:
+    yaml = pytest.importorskip("yaml")
+    text = config.read_text(encoding="utf-8")
+
+    assert _fallback_yaml_load(text) == (yaml.safe_load(text) or {})
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("{a: True, b: None, c: ~}", {"a": True, "b": None, "c": None}),
+        ("[False, Null, TRUE]", [False, None, True]),
+        ("[None]", [None]),
+        ('{rxn: "True ~", lb: 3.15}', {"rxn": "True ~", "lb": 3.15}),
+        ("{a: .5}", {"a": 0.5}),
+        ("{a: -.5}", {"a": -0.5}),
+        ("{a: 1.}", {"a": 1.0}),
+        ("{a: +1}", {"a": 1}),
+        ("{a: 1_000}", {"a": 1000}),
+        ("[1, 2,]", [1, 2]),
+        ("{a: true, b: .5}", {"a": True, "b": 0.5}),
+    ],
+)
+def test_inline_structure_accepts_capitalised_scalars(value: str, expected: object) -> None:
+    assert _parse_inline_structure(value) == expected
@@ -0,0 +1,61 @@
+from pathlib import Path
+from typing import Callable, Optional, Set
+
+import pytest
+
+from gapx.config.models import GAConfig, RunConfig
+from pydantic import BaseModel, Field
+
+
+def test_default_instances_do_not_share_state() -> None:
+    first = GAConfig()
+    second = GAConfig()
+
+    first.selection.k = 9
+    first.constraints.enforce_task_pass_for.append("growth_m9_glucose")
+
+    assert second.selection.k == 3
+    assert second.constraints.enforce_task_pass_for == []
+    assert GAConfig().dict() == second.dict()
+
+    class Tagged(BaseModel):
+        tags: Set[str] = Field(default_factory=set)
+
+    Tagged().tags.add("x")
+    assert Tagged().tags == set()
+
+
+def test_literal_fields_reject_unknown_values() -> None:
+    with pytest.raises(ValueError, match="device"):
+        RunConfig(name="demo", output_dir="runs/demo", device="tpu")
+
+    assert RunConfig(name="demo", output_dir="runs/demo", device="cuda").device == "cuda"
+
+
+def test_subclass_can_override_plain_default() -> None:
+    class Base(BaseModel):
+        n: int = 0
+
+    class Child(Base):
+        n: int = 5
+
+    assert Base().n == 0
+    assert Child().n == 5
+    assert Child(n=7).n == 7
+
+
+def test_field_with_callable_class_value_is_slotted() -> None:
+    class Model(BaseModel):
+        func: Optional[Callable] = len
+
+    assert Model().func is None
+    assert Model(func=abs).func is abs
+
+
+def test_construct_rebuilds_nested_models_without_validation() -> None:
+    config = RunConfig.construct(name="demo", output_dir="runs/demo", parallel={"islands": 2})
+
+    assert config.output_dir == Path("runs/demo")
+    assert config.parallel.islands == 2
+    assert config.parallel.migrants == 1
+    assert config.device == "cpu"